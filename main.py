@@ -1,7 +1,11 @@
 # main.py
+import logging
+import logging.handlers
+import queue
 import socket
 import subprocess
-import time
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from src.rfid_audio_player import AudioPlayer, Reader, ButtonControls, WebServer
@@ -28,6 +32,23 @@ def _get_ip_address() -> Optional[str]:
     return ip_address
 
 
+def _start_logging() -> logging.handlers.QueueListener:
+    """
+    Routes log records through a queue so threads such as the RFID poller
+    only enqueue them; a listener thread does the console writes.
+    """
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+
 def _speak_ip_address(player: AudioPlayer) -> None:
     ip_address = _get_ip_address()
     if not ip_address:
@@ -45,6 +66,8 @@ if __name__ == "__main__":
     Initializes all components and runs the main loop.
     """
     
+    log_listener = _start_logging()
+
     # Initialize components
     player = None
     reader = None
@@ -54,8 +77,15 @@ if __name__ == "__main__":
     try:
         # 1. Initialize the core components
         print("🎵 Initializing PhonieBox Minimal...")
-        player = AudioPlayer()
-        reader = Reader()
+        # Open the RC522 (SPI setup + settle delay) on a worker thread
+        # while the audio device is being opened.
+        with ThreadPoolExecutor(max_workers=1) as startup_pool:
+            reader_future = startup_pool.submit(Reader)
+            player = AudioPlayer()
+            reader = reader_future.result()
+        # A new tag ends the main loop's wait straight away
+        reader.on_tag = player.wake
+        reader.start_polling()
 
         # 2. Initialize the button handler and pass it the player
         #    This automatically links all button events.
@@ -75,10 +105,18 @@ if __name__ == "__main__":
 
         # 4. Start the main application loop
         while True:
-            # Check for a new RFID tag.
-            # The reader.read_tag() method is smart and will
-            # only return a UID once when a *new* tag is presented.
-            uid, text = reader.read_tag()
+            # Wait up to 500ms for a new RFID tag or the end of
+            # the current track.
+            # The reader polls on its own thread and only queues
+            # a UID once when a *new* tag is presented; both a scan
+            # and pygame's end-of-music event wake the loop
+            # immediately. The wait is idle time, preventing the
+            # loop from using 100% CPU.
+            if player.wait(0.5):
+                uid, text = reader.get_tag()
+            else:
+                # No event queue: wait on the reader alone
+                uid, text = reader.get_tag(timeout=0.5)
             
             if uid is not None:
                 print(f"Main loop detected new UID: {uid}, text {text}")
@@ -89,16 +127,14 @@ if __name__ == "__main__":
                     if tag_text.upper() == "IP":
                         _speak_ip_address(player)
                     else:
-                        player.load_playlist(tag_text)
+                        player.load_playlist(tag_text, from_tag=True)
             
             # Check if the current song has finished playing.
             # This is necessary for auto-playing the next track.
+            # The mixer is only queried once pygame reports the
+            # music has ended.
             player.check_for_song_end()
 
-            # Poll every 100ms. This is idle time, preventing
-            # the loop from using 100% CPU.
-            time.sleep(0.5)
-
     except KeyboardInterrupt:
         print("\n\n🛑 Shutting down... (Ctrl+C pressed)")
 
@@ -113,4 +149,5 @@ if __name__ == "__main__":
             print("  ✓ RFID reader cleaned up")
         if buttons:
             buttons.cleanup()
+        log_listener.stop()
         print("\n👋 Goodbye!")
@@ -4,6 +4,7 @@ Test script for writing "Hello world" to an RFID tag.
 Demonstrates the write_text method with verbose debugging output.
 """
 
+import logging
 import sys
 import time
 from pathlib import Path
@@ -26,6 +27,8 @@ def main():
     print("Verbose debugging information will be printed throughout.")
     print()
 
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     # Initialize the RFID reader
     print("Step 1: Initializing RFID reader...")
     print("-" * 60)
@@ -1,10 +1,26 @@
 """RFID Audio Player - A Raspberry Pi-based RFID-triggered audio player."""
 
+import importlib
+
 __version__ = "0.1.0"
 
-from .audio_player import AudioPlayer
-from .rfid_reader import Reader
-from .button_handler import ButtonControls
-from .web_server import WebServer
+# Public classes and the submodule that defines each. They are imported on
+# first access so that e.g. importing rfid_reader alone doesn't pull in
+# pygame, Flask and gpiozero.
+_EXPORTS = {
+    'AudioPlayer': '.audio_player',
+    'Reader': '.rfid_reader',
+    'ButtonControls': '.button_handler',
+    'WebServer': '.web_server',
+}
 
 __all__ = ['AudioPlayer', 'Reader', 'ButtonControls', 'WebServer']
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,21 +2,55 @@
 import os
 import shutil
 import subprocess
+import threading
 import time
-from random import shuffle
+from random import sample
 from typing import Optional
 
 import pygame
 from mutagen import File as MutagenFile
 from .config import (
     MEDIA_PATH, SUPPORTED_EXTENSIONS,
-    DEFAULT_VOLUME
+    DEFAULT_VOLUME, AUDIO_BUFFER_FRAMES
 )
 
+# Posted by pygame whenever the music stream stops
+MUSIC_END_EVENT = pygame.USEREVENT + 1
+# Posted by AudioPlayer.wake() to end a wait() early
+WAKE_EVENT = pygame.USEREVENT + 2
+
+
+def folder_signature(folder_path: str) -> tuple[int, ...]:
+    """
+    Returns the modification times of the folder and its 'Converted'
+    subfolder. Adding or removing files changes the signature.
+    """
+    signature = []
+    for directory in (folder_path, os.path.join(folder_path, 'Converted')):
+        try:
+            signature.append(os.stat(directory).st_mtime_ns)
+        except FileNotFoundError:
+            signature.append(0)
+    return tuple(signature)
+
+
 class AudioPlayer:
+    __slots__ = (
+        'current_playlist', '_playlist_seekable', '_current_key', 'current_track_index',
+        'paused', 'playing', 'current_track_duration', 'current_track_position',
+        'current_track_started_at', 'seek_supported', '_playlist_cache',
+        '_prefetched_path', '_tts_command', '_end_events_enabled',
+        '_last_busy_check', '_volume', '_end_pending',
+    )
+
+    # Volume moves in 10% steps, so there are only 11 possible bars
+    _VOL_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
     def __init__(self):
         """Initializes the pygame mixer."""
         try:
+            # Open the output device once with a buffer large enough for the Pi
+            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=AUDIO_BUFFER_FRAMES)
             pygame.mixer.init()
             pygame.mixer.music.set_volume(DEFAULT_VOLUME)
             print("AudioPlayer initialized.")
@@ -24,8 +58,21 @@ class AudioPlayer:
             print(f"Error initializing pygame mixer: {e}")
             print("Do you have a valid audio output device connected (e.g., USB audio)?")
 
+        # Music end events go through the SDL event queue, which only exists
+        # once the display subsystem is up. The dummy driver needs no screen.
+        self._end_events_enabled = True
+        try:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            pygame.display.init()
+            pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+        except pygame.error as e:
+            print(f"Music end events unavailable ({e}), polling the mixer instead.")
+            self._end_events_enabled = False
+
         # State variables
-        self.current_playlist = []  # List of full file paths
+        self.current_playlist: list[tuple[str, str]] = []  # (full path, file name) per track
+        self._playlist_seekable: list[bool] = []  # Parallel to current_playlist
+        self._current_key: Optional[str] = None  # Folder key of the loaded playlist
         self.current_track_index = -1
         self.paused = False
         self.playing = False
@@ -33,14 +80,41 @@ class AudioPlayer:
         self.current_track_position = 0.0
         self.current_track_started_at: Optional[float] = None
         self.seek_supported = False
+        # Volume as last set, so presses don't round-trip through the mixer
+        self._volume = DEFAULT_VOLUME
+
+        # Path of the track most recently handed to the page-cache prefetcher
+        self._prefetched_path: Optional[str] = None
+
+        # TTS engine, looked up on first use of speak_text()
+        self._tts_command: Optional[str] = None
 
-    def load_playlist(self, key):
+        # When end events are unavailable, time of the last get_busy() query
+        self._last_busy_check = 0.0
+        # Set when wait() takes the end event off the queue
+        self._end_pending = False
+
+        # Folder key -> (folder signature, audio file paths) from the last scan
+        self._playlist_cache: dict[str, tuple[tuple[int, ...], list[tuple[str, str]]]] = {}
+
+    def load_playlist(self, key, from_tag=False):
         """
         Loads a new playlist based on a key.
         Returns True on success so web requests can report errors.
+
+        With `from_tag`, re-presenting the tag of the playlist that is
+        already playing keeps it going (resuming it if paused) instead of
+        rescanning and restarting it. Other callers always restart it.
         """
-        existing_folders = os.listdir(MEDIA_PATH)
-        if key not in existing_folders:
+        if from_tag and key == self._current_key and self.playing:
+            print(f"Playlist '{key}' is already loaded.")
+            if self.paused:
+                self.toggle_pause()
+            return True
+
+        # The key must name a folder directly inside MEDIA_PATH; checking the
+        # name itself avoids listing the whole media directory on every tap.
+        if not key or key in ('.', '..') or os.path.basename(key) != key:
             print(f"Error: no folder named {key} in media directory.")
             return False
 
@@ -50,15 +124,27 @@ class AudioPlayer:
             print(f"Error: Directory not found: {folder_path}")
             return False
 
-        # Scan the directory (and nested Converted folder if present) for supported audio files
-        self.current_playlist = self._gather_audio_files(folder_path)
-        shuffle(self.current_playlist)
+        # Scan the directory (and nested Converted folder if present) for supported audio files,
+        # reusing the previous scan if neither folder has changed since.
+        signature = folder_signature(folder_path)
+        cached = self._playlist_cache.get(key)
+        if cached and cached[0] == signature:
+            files = cached[1]
+        else:
+            files = self._gather_audio_files(folder_path)
+            self._playlist_cache[key] = (signature, files)
+
+        self._current_key = None
+        # Shuffled copy; the cached scan result is never mutated.
+        self.current_playlist = sample(files, len(files))
+        self._playlist_seekable = [self._supports_seeking(path) for path, _ in self.current_playlist]
 
         if not self.current_playlist:
             print(f"No audio files found in {folder_path}")
             return False
         
         print(f"Loaded {len(self.current_playlist)} tracks from '{key}'.")
+        self._current_key = key
         self.current_track_index = 0
         self._play_current_track()
         return True
@@ -69,11 +155,11 @@ class AudioPlayer:
             print("No playlist loaded.")
             return False
 
-        track_path = self.current_playlist[self.current_track_index]
+        track_path, track_name = self.current_playlist[self.current_track_index]
         try:
             pygame.mixer.music.load(track_path)
             self.current_track_duration = self._get_track_duration(track_path)
-            self.seek_supported = self._supports_seeking(track_path)
+            self.seek_supported = self._playlist_seekable[self.current_track_index]
             start_position = self._clamp_position(start_position)
 
             if start_position > 0:
@@ -87,15 +173,48 @@ class AudioPlayer:
             self.paused = False
             track_num = self.current_track_index + 1
             total_tracks = len(self.current_playlist)
-            print(f"♪ Now Playing [{track_num}/{total_tracks}]: {os.path.basename(track_path)}")
+            print(f"♪ Now Playing [{track_num}/{total_tracks}]: {track_name}")
+            self._prefetch_next_track()
             return True
         except NotImplementedError:
-            print(f"❌ Seeking is not supported for {os.path.basename(track_path)}")
+            print(f"❌ Seeking is not supported for {track_name}")
             return False
         except pygame.error as e:
             print(f"❌ Error playing track {track_path}: {e}")
             return False
 
+    def _prefetch_next_track(self):
+        """
+        Warms the page cache with the next track in a background thread so
+        the following track change doesn't wait on the SD card.
+        """
+        if len(self.current_playlist) < 2:
+            return
+
+        next_index = (self.current_track_index + 1) % len(self.current_playlist)
+        next_path = self.current_playlist[next_index][0]
+        if next_path == self._prefetched_path:
+            return
+
+        self._prefetched_path = next_path
+        threading.Thread(target=self._warm_page_cache, args=(next_path,), daemon=True).start()
+
+    def _warm_page_cache(self, track_path: str):
+        try:
+            fd = os.open(track_path, os.O_RDONLY)
+        except OSError:
+            return
+
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                os.read(fd, 1 << 20)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
     def toggle_pause(self):
         """Toggles play/pause state."""
         if not self.playing:
@@ -138,27 +257,84 @@ class AudioPlayer:
 
     def volume_up(self):
         """Increases volume by 10%."""
-        current_vol = pygame.mixer.music.get_volume()
-        new_vol = min(current_vol + 0.1, 1.0) # Cap at 1.0
-        pygame.mixer.music.set_volume(new_vol)
-        vol_bar = "█" * int(new_vol * 10) + "░" * (10 - int(new_vol * 10))
-        print(f"🔊 Volume: [{vol_bar}] {int(new_vol * 100)}%")
+        self._adjust_volume(0.1, "🔊")
 
     def volume_down(self):
         """Decreases volume by 10%."""
-        current_vol = pygame.mixer.music.get_volume()
-        new_vol = max(current_vol - 0.1, 0.0) # Floor at 0.0
-        pygame.mixer.music.set_volume(new_vol)
-        vol_bar = "█" * int(new_vol * 10) + "░" * (10 - int(new_vol * 10))
-        print(f"🔉 Volume: [{vol_bar}] {int(new_vol * 100)}%")
+        self._adjust_volume(-0.1, "🔉")
+
+    def _adjust_volume(self, delta: float, icon: str):
+        """
+        Shifts the volume by delta, clamped to 0.0-1.0, and prints a bar.
+        Nothing is printed at the limits, where a held button keeps firing.
+        """
+        new_vol = round(min(max(self._volume + delta, 0.0), 1.0), 2)
+        if new_vol == self._volume:
+            return
+        self.set_volume(new_vol)
+        percent = round(new_vol * 100)
+        print(f"{icon} Volume: [{self._VOL_BARS[percent // 10]}] {percent}%")
+
+    def set_volume(self, volume: float):
+        """Sets the music volume (0.0-1.0)."""
+        self._volume = volume
+        pygame.mixer.music.set_volume(volume)
+
+    def get_volume(self) -> float:
+        """Returns the volume as last set, without querying the mixer."""
+        return self._volume
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Blocks until the current track ends, wake() is called or `timeout`
+        seconds pass. Returns False straight away if the event queue is
+        unavailable, so the caller has to wait some other way.
+        """
+        if not self._end_events_enabled:
+            return False
+        try:
+            event = pygame.event.wait(int(timeout * 1000))
+        except pygame.error:
+            print("Music end events unavailable, polling the mixer instead.")
+            self._end_events_enabled = False
+            return False
+        if event.type == MUSIC_END_EVENT:
+            self._end_pending = True
+        return True
+
+    def wake(self):
+        """Ends a wait() in progress. Safe to call from any thread."""
+        if self._end_events_enabled:
+            try:
+                pygame.event.post(pygame.event.Event(WAKE_EVENT))
+            except pygame.error:
+                pass
 
     def check_for_song_end(self):
         """
         To be called in the main loop. Checks if a song has
         finished and automatically plays the next one.
+
+        Only queries the mixer after pygame has posted its end-of-music
+        event. Without the event queue, the mixer is polled at most once a
+        second until the track is within a few seconds of its known end.
         """
+        if self._end_events_enabled:
+            ended, self._end_pending = self._end_pending, False
+            try:
+                ended = bool(pygame.event.get(MUSIC_END_EVENT)) or ended
+            except pygame.error:
+                print("Music end events unavailable, polling the mixer instead.")
+                self._end_events_enabled = False
+                ended = True
+            if not ended:
+                return
+        elif not self._busy_check_due():
+            return
+
         if self.playing and not self.paused:
-            # get_busy() returns True if music is playing
+            # get_busy() returns True if music is playing. This also filters out
+            # end events left over from loading or stopping a previous track.
             if not pygame.mixer.music.get_busy():
                 # Check if we're at the last track
                 is_last_track = (self.current_track_index == len(self.current_playlist) - 1)
@@ -172,10 +348,27 @@ class AudioPlayer:
                     print("Song finished, playing next.")
                     self.next_track()
 
+    def _busy_check_due(self) -> bool:
+        if not self.playing or self.paused:
+            return False
+
+        if self.current_track_duration > 0:
+            remaining = self.current_track_duration - self.get_current_position()
+            if remaining <= 5.0:
+                return True
+
+        now = time.monotonic()
+        if now - self._last_busy_check < 1.0:
+            return False
+        self._last_busy_check = now
+        return True
+
     def stop(self):
         """Stops playback and clears the playlist."""
         pygame.mixer.music.stop()
         self.current_playlist = []
+        self._playlist_seekable = []
+        self._current_key = None
         self.current_track_index = -1
         self.playing = False
         self.paused = False
@@ -188,10 +381,10 @@ class AudioPlayer:
         """Shuts down the mixer."""
         pygame.mixer.quit()
 
-    def _gather_audio_files(self, folder_path: str) -> list[str]:
+    def _gather_audio_files(self, folder_path: str) -> list[tuple[str, str]]:
         """
-        Returns a list of supported audio file paths from the folder and
-        its nested 'Converted' subfolder (if present).
+        Returns (path, name) pairs for supported audio files in the folder
+        and its nested 'Converted' subfolder (if present).
         """
         files = []
         search_dirs = [folder_path]
@@ -199,11 +392,19 @@ class AudioPlayer:
         if os.path.isdir(converted_dir):
             search_dirs.append(converted_dir)
 
+        # Local bindings keep the per-entry loop on fast local lookups
+        exts = SUPPORTED_EXTENSIONS
+        append = files.append
         for directory in search_dirs:
             try:
-                for entry in os.listdir(directory):
-                    if any(entry.lower().endswith(ext) for ext in SUPPORTED_EXTENSIONS):
-                        files.append(os.path.join(directory, entry))
+                # scandir hands back the joined path and cached file type,
+                # so no extra join/stat per entry.
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if not entry.is_file():
+                            continue
+                        if entry.name.lower().endswith(exts):
+                            append((entry.path, entry.name))
             except FileNotFoundError:
                 continue
         return files
@@ -237,15 +438,22 @@ class AudioPlayer:
                 self.paused = False
 
     def _find_tts_command(self) -> Optional[str]:
-        for candidate in ("espeak", "espeak-ng", "spd-say"):
-            if shutil.which(candidate):
-                return candidate
-        return None
+        if self._tts_command is None:
+            for candidate in ("espeak", "espeak-ng", "spd-say"):
+                if shutil.which(candidate):
+                    self._tts_command = candidate
+                    break
+        return self._tts_command
 
     def get_current_track_path(self) -> Optional[str]:
         if not self.current_playlist or self.current_track_index < 0:
             return None
-        return self.current_playlist[self.current_track_index]
+        return self.current_playlist[self.current_track_index][0]
+
+    def get_current_track_name(self) -> Optional[str]:
+        if not self.current_playlist or self.current_track_index < 0:
+            return None
+        return self.current_playlist[self.current_track_index][1]
 
     def get_current_position(self) -> float:
         if self.current_track_index < 0:
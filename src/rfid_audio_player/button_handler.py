@@ -1,19 +1,31 @@
 # button_handler.py
-from gpiozero import Button
-from datetime import datetime
+import logging
+import time
+
+from gpiozero import ButtonBoard
 from .config import (
     PIN_PLAY_PAUSE,
     PIN_VOL_UP,
     PIN_VOL_DOWN,
     PIN_NEXT,
-    PIN_PREV
+    PIN_PREV,
+    BUTTON_BOUNCE_TIME_S
 )
 
+# Presses are logged rather than printed so the gpiozero callback thread
+# hands the message to the queue-backed handler set up in main.py.
+logger = logging.getLogger(__name__)
+
 class ButtonControls:
     """
     Manages all GPIO button inputs and links them to
     audio player actions.
     """
+    __slots__ = (
+        'audio_player', 'board', 'btn_play_pause', 'btn_vol_up',
+        'btn_vol_down', 'btn_next', 'btn_prev',
+    )
+
     def __init__(self, audio_player):
         """
         Initializes all buttons.
@@ -26,27 +38,45 @@ class ButtonControls:
         # Store reference to audio player
         self.audio_player = audio_player
 
+        # All five buttons share one board so they are created together
+        # with a single pull-up and debounce configuration.
+        self.board = ButtonBoard(
+            play_pause=PIN_PLAY_PAUSE,
+            vol_up=PIN_VOL_UP,
+            vol_down=PIN_VOL_DOWN,
+            next_track=PIN_NEXT,
+            prev_track=PIN_PREV,
+            pull_up=True,
+            bounce_time=BUTTON_BOUNCE_TIME_S,
+        )
+
         # We pass the audio_player object in so we can link
         # its methods directly to the button press events.
 
         # Play/Pause Button
-        self.btn_play_pause = Button(PIN_PLAY_PAUSE, pull_up=True, bounce_time=0.1)
+        self.btn_play_pause = self.board.play_pause
         self.btn_play_pause.when_pressed = self._on_play_pause
 
         # Volume Up Button
-        self.btn_vol_up = Button(PIN_VOL_UP, pull_up=True, bounce_time=0.1)
+        self.btn_vol_up = self.board.vol_up
         self.btn_vol_up.when_pressed = self._on_volume_up
+        self.btn_vol_up.hold_time = 0.4
+        self.btn_vol_up.hold_repeat = True
+        self.btn_vol_up.when_held = self._on_volume_up
 
         # Volume Down Button
-        self.btn_vol_down = Button(PIN_VOL_DOWN, pull_up=True, bounce_time=0.1)
+        self.btn_vol_down = self.board.vol_down
         self.btn_vol_down.when_pressed = self._on_volume_down
+        self.btn_vol_down.hold_time = 0.4
+        self.btn_vol_down.hold_repeat = True
+        self.btn_vol_down.when_held = self._on_volume_down
 
         # Next Track Button
-        self.btn_next = Button(PIN_NEXT, pull_up=True, bounce_time=0.1)
+        self.btn_next = self.board.next_track
         self.btn_next.when_pressed = self._on_next_track
 
         # Previous Track Button
-        self.btn_prev = Button(PIN_PREV, pull_up=True, bounce_time=0.1)
+        self.btn_prev = self.board.prev_track
         self.btn_prev.when_pressed = self._on_prev_track
 
         print("✓ Button controls initialized and linked to audio player.")
@@ -56,14 +86,19 @@ class ButtonControls:
         print(f"  - Next Track: GPIO {PIN_NEXT}")
         print(f"  - Prev Track: GPIO {PIN_PREV}")
 
-        # Note: 'bounce_time=0.1' (100ms) is added to prevent
-        # a single physical press from registering multiple times.
+        # Note: 'bounce_time' (BUTTON_BOUNCE_TIME_S) prevents a single
+        # physical press from registering multiple times. Holding a volume
+        # button repeats the step every 0.4s.
+
+    @staticmethod
+    def _log_press(name: str, pin: int) -> None:
+        """Logs a button press with a wall-clock timestamp."""
+        logger.info("[%s] Button pressed: %s (GPIO %d)", time.strftime("%H:%M:%S"), name, pin)
 
     def _on_play_pause(self, button):
         """Handler for play/pause button press."""
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            print(f"[{timestamp}] Button pressed: Play/Pause (GPIO {PIN_PLAY_PAUSE})")
+            self._log_press("Play/Pause", PIN_PLAY_PAUSE)
             self.audio_player.toggle_pause()
         except Exception as e:
             print(f"❌ Error handling play/pause: {e}")
@@ -71,8 +106,7 @@ class ButtonControls:
     def _on_volume_up(self, button):
         """Handler for volume up button press."""
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            print(f"[{timestamp}] Button pressed: Volume Up (GPIO {PIN_VOL_UP})")
+            self._log_press("Volume Up", PIN_VOL_UP)
             self.audio_player.volume_up()
         except Exception as e:
             print(f"❌ Error handling volume up: {e}")
@@ -80,8 +114,7 @@ class ButtonControls:
     def _on_volume_down(self, button):
         """Handler for volume down button press."""
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            print(f"[{timestamp}] Button pressed: Volume Down (GPIO {PIN_VOL_DOWN})")
+            self._log_press("Volume Down", PIN_VOL_DOWN)
             self.audio_player.volume_down()
         except Exception as e:
             print(f"❌ Error handling volume down: {e}")
@@ -89,8 +122,7 @@ class ButtonControls:
     def _on_next_track(self, button):
         """Handler for next track button press."""
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            print(f"[{timestamp}] Button pressed: Next Track (GPIO {PIN_NEXT})")
+            self._log_press("Next Track", PIN_NEXT)
             self.audio_player.next_track()
         except Exception as e:
             print(f"❌ Error handling next track: {e}")
@@ -98,8 +130,7 @@ class ButtonControls:
     def _on_prev_track(self, button):
         """Handler for previous track button press."""
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            print(f"[{timestamp}] Button pressed: Previous Track (GPIO {PIN_PREV})")
+            self._log_press("Previous Track", PIN_PREV)
             self.audio_player.prev_track()
         except Exception as e:
             print(f"❌ Error handling previous track: {e}")
@@ -107,11 +138,7 @@ class ButtonControls:
     def cleanup(self):
         """Clean up GPIO resources."""
         try:
-            self.btn_play_pause.close()
-            self.btn_vol_up.close()
-            self.btn_vol_down.close()
-            self.btn_next.close()
-            self.btn_prev.close()
+            self.board.close()
             print("✓ Button controls cleaned up.")
         except Exception as e:
             print(f"Warning: Error during button cleanup: {e}")
\ No newline at end of file
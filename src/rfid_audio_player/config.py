@@ -7,20 +7,39 @@ PIN_VOL_DOWN = 23
 PIN_NEXT = 16
 PIN_PREV = 26
 
+# Button debounce window in seconds. 20 ms covers typical tactile switch
+# bounce without swallowing quick repeated presses.
+BUTTON_BOUNCE_TIME_S = 0.02
+
 # RFID Reset Pin (physical)
 PIN_RFID_RST = 22
 
+# RFID IRQ Pin (physical). Set to the pin wired to the RC522 IRQ line to
+# wait for card-detect interrupts instead of polling; None if it isn't
+# wired. pirc522 numbers pins in BOARD mode, so use the header pin number,
+# not the BCM number. With None, pirc522 still sets up its default IRQ
+# input on physical pin 18, but the reader keeps polling.
+PIN_RFID_IRQ = None
+
+# SPI clock for the RC522 (the chip supports up to 10 MHz; the pirc522
+# default is 1 MHz). Lower this if reads fail on long or noisy wiring.
+RFID_SPI_SPEED_HZ = 8_000_000
+
 # --- Audio Player Settings ---
 
 # Path to your media parent directory
 MEDIA_PATH = "media/"
 
-# Supported audio file extensions
-SUPPORTED_EXTENSIONS = ['.mp3', '.ogg', '.wav']
+# Supported audio file extensions (lowercase; a tuple so str.endswith() accepts it)
+SUPPORTED_EXTENSIONS = ('.mp3', '.ogg', '.wav')
 
 # Initial volume (from 0.0 to 1.0)
 DEFAULT_VOLUME = 0.5
 
+# Mixer buffer size in sample frames. Larger buffers avoid underruns
+# (crackling/popping) on the Pi at the cost of a little output latency.
+AUDIO_BUFFER_FRAMES = 4096
+
 # --- RFID Tag Writing Settings ---
 
 # NTAG215 pages that hold the NFC Forum TLV (page 4 is the first writable page).
@@ -1,15 +1,109 @@
 # rfid_reader.py
+import asyncio
+import codecs
+import logging
+import queue
+import struct
+import threading
 import time
-from typing import List, Optional
+import uuid
+from typing import Callable, List, Optional
 
 from pirc522 import RFID
 
 from .config import (
+    PIN_RFID_IRQ,
     PIN_RFID_RST,
+    RFID_SPI_SPEED_HZ,
     TAG_NDEF_START_PAGE,
     TAG_NDEF_PAGE_COUNT,
 )
 
+# Per-scan messages go through logging so the poll thread never blocks
+# on a slow console; see main.py for the queue-backed handler.
+logger = logging.getLogger(__name__)
+
+# Attempts per 16-byte READ before a tag read is abandoned
+READ_ATTEMPTS = 3
+
+# Finished write jobs kept for get_write_job() before the oldest is dropped
+MAX_WRITE_JOBS = 32
+
+# NTAG21x FAST_READ returns a page range in one exchange. The RC522 FIFO
+# holds 64 bytes, so one response carries at most 15 pages plus CRC.
+NTAG_READ_CMD = 0x30
+NTAG_WRITE_CMD = 0xA2
+NTAG_FAST_READ_CMD = 0x3A
+FAST_READ_MAX_PAGES = 15
+
+# MFRC522 registers used by Reader._transceive()
+_COMMAND_REG = 0x01
+_COM_IEN_REG = 0x02
+_COM_IRQ_REG = 0x04
+_ERROR_REG = 0x06
+_FIFO_DATA_REG = 0x09
+_FIFO_LEVEL_REG = 0x0A
+_BIT_FRAMING_REG = 0x0D
+# SPI address bytes for writing/reading the FIFO (MSB set = read)
+_FIFO_WRITE_ADDR = (_FIFO_DATA_REG << 1) & 0x7E
+_FIFO_READ_ADDR = _FIFO_WRITE_ADDR | 0x80
+
+# Big-endian length fields in TLV headers and long NDEF records
+_U16BE = struct.Struct(">H")
+_U32BE = struct.Struct(">I")
+# Short text record prefix: header, type length, payload length, type, status
+_TEXT_RECORD_PREFIX = struct.Struct(">BBBcB")
+
+# Text record decoders, indexed by the status byte's UTF-16 flag
+_TEXT_DECODERS = (codecs.getdecoder("utf-8"), codecs.getdecoder("utf-16"))
+
+
+def _tlv_area_end(buf: bytearray, filled: int) -> Optional[int]:
+    """
+    Returns how many bytes of `buf` are needed to hold the first NDEF TLV
+    (or everything up to a Terminator TLV), or None if the first `filled`
+    bytes do not contain it yet.
+    """
+    idx = 0
+    while idx < filled:
+        tlv_type = buf[idx]
+        if tlv_type == 0x00:
+            idx += 1
+            continue
+        if tlv_type == 0xFE:
+            return idx + 1
+        if idx + 1 >= filled:
+            return None
+
+        length = buf[idx + 1]
+        header = 2
+        if length == 0xFF:
+            if idx + 3 >= filled:
+                return None
+            length = _U16BE.unpack_from(buf, idx + 2)[0]
+            header = 4
+
+        end = idx + header + length
+        if tlv_type == 0x03:
+            return end if end <= filled else None
+        idx = end
+
+    return None
+
+
+def _crc_a(data: List[int]) -> List[int]:
+    """
+    ISO/IEC 14443-3 CRC_A, low byte first. Computing it here replaces
+    pirc522's calculate_crc(), which uses the RC522's CRC coprocessor
+    at the cost of one SPI transfer per input byte plus polling.
+    """
+    crc = 0x6363
+    for byte in data:
+        byte ^= crc & 0xFF
+        byte = (byte ^ (byte << 4)) & 0xFF
+        crc = (crc >> 8) ^ (byte << 8) ^ (byte << 3) ^ (byte >> 4)
+    return [crc & 0xFF, crc >> 8]
+
 
 class Reader:
     """
@@ -18,18 +112,226 @@ class Reader:
     on the card.
     """
 
+    __slots__ = (
+        'rfid', 'last_uid', '_lock', 'tags', '_stop_polling',
+        '_poll_thread', '_waiter', '_waiter_lock', '_write_jobs',
+        '_write_results', '_write_results_lock', 'on_tag',
+    )
+
     def __init__(self):
         self.rfid: Optional[RFID] = None
-        self.last_uid: Optional[str] = None
+        # UID bytes packed into an int so repeat polls compare cheaply
+        self.last_uid: Optional[int] = None
+
+        # Serialises SPI access between the poll thread and tag writes
+        self._lock = threading.Lock()
+        # Holds the most recent (uid, text) found by the poll thread
+        self.tags: queue.Queue = queue.Queue(maxsize=1)
+        self._stop_polling = threading.Event()
+        self._poll_thread: Optional[threading.Thread] = None
+        # (loop, future) of a read_tag_async() call waiting for the next tag
+        self._waiter: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = None
+        self._waiter_lock = threading.Lock()
+        # Tag writes queued for the poll thread, and their status by job id
+        self._write_jobs: queue.Queue = queue.Queue()
+        self._write_results: dict[str, dict] = {}
+        # Guards _write_results and hand-off to the poll thread; web
+        # requests and the poll thread update it concurrently
+        self._write_results_lock = threading.Lock()
+        # Called from the poll thread after each new tag is published
+        self.on_tag: Optional[Callable[[], None]] = None
 
         try:
-            self.rfid = RFID(pin_rst=PIN_RFID_RST, bus=0, device=0)
+            rfid_kwargs = {'pin_rst': PIN_RFID_RST, 'bus': 0, 'device': 0, 'speed': RFID_SPI_SPEED_HZ}
+            if PIN_RFID_IRQ is not None:
+                rfid_kwargs['pin_irq'] = PIN_RFID_IRQ
+            self.rfid = RFID(**rfid_kwargs)
             time.sleep(0.1)  # Allow the RC522 to stabilise.
-            print("RFID reader initialised (SPI bus 0, device 0)")
+            print(f"RFID reader initialised (SPI bus 0, device 0, {RFID_SPI_SPEED_HZ // 1_000_000} MHz)")
         except Exception as exc:
             print(f"Error initialising RFID reader: {exc}")
             print("Ensure SPI is enabled and the RC522 is wired correctly.")
 
+    def start_polling(self, interval: float = 0.2) -> None:
+        """
+        Starts a background thread that calls read_tag() every `interval`
+        seconds and queues each new tag for get_tag().
+        """
+        if not self.rfid or self._poll_thread is not None:
+            return
+
+        self._stop_polling.clear()
+        self._poll_thread = threading.Thread(target=self._poll_loop, args=(interval,), daemon=True)
+        self._poll_thread.start()
+        print(f"RFID polling thread started ({interval * 1000:.0f}ms interval)")
+
+    def get_tag(self, timeout: Optional[float] = None) -> tuple[Optional[str], Optional[str]]:
+        """
+        Returns the next (uid, text) queued by the poll thread, or
+        (None, None) if no new tag arrives. Waits up to `timeout` seconds
+        for one; by default it does not block.
+        """
+        try:
+            if timeout is None:
+                return self.tags.get_nowait()
+            return self.tags.get(timeout=timeout)
+        except queue.Empty:
+            return None, None
+
+    async def read_tag_async(self) -> tuple[str, Optional[str]]:
+        """
+        Awaits the next (uid, text) found by the poll thread. Requires
+        start_polling(); only one coroutine should await tags at a time.
+        """
+        loop = asyncio.get_running_loop()
+        with self._waiter_lock:
+            try:
+                return self.tags.get_nowait()
+            except queue.Empty:
+                future = loop.create_future()
+                self._waiter = (loop, future)
+
+        try:
+            return await future
+        finally:
+            with self._waiter_lock:
+                if self._waiter is not None and self._waiter[1] is future:
+                    self._waiter = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> tuple[str, Optional[str]]:
+        return await self.read_tag_async()
+
+    def _publish_tag(self, tag: tuple[str, Optional[str]]) -> None:
+        """
+        Hands a new tag to a waiting read_tag_async() call, or queues it
+        for get_tag() and calls on_tag if nobody is awaiting.
+        """
+        with self._waiter_lock:
+            waiter, self._waiter = self._waiter, None
+            if waiter is not None:
+                loop, future = waiter
+                try:
+                    loop.call_soon_threadsafe(self._resolve_waiter, future, tag)
+                    return
+                except RuntimeError:
+                    pass  # Event loop already closed
+
+            # Only the newest tag matters; drop one the main loop hasn't taken yet.
+            try:
+                self.tags.get_nowait()
+            except queue.Empty:
+                pass
+            self.tags.put_nowait(tag)
+
+        on_tag = self.on_tag
+        if on_tag is not None:
+            on_tag()
+
+    def _resolve_waiter(self, future: asyncio.Future, tag: tuple[str, Optional[str]]) -> None:
+        # Runs on the event loop. If the awaiting coroutine was cancelled
+        # after the hand-off, publish the tag again rather than losing it.
+        if future.done():
+            self._publish_tag(tag)
+        else:
+            future.set_result(tag)
+
+    def submit_write(self, text: str, lang_code: str = "en") -> str:
+        """
+        Queues write_text() for the poll thread, which owns the SPI bus,
+        and returns a job id for get_write_job(). Without a running poll
+        thread the write happens before this returns.
+        """
+        job_id = uuid.uuid4().hex
+        with self._write_results_lock:
+            self._write_results[job_id] = {'text': text, 'status': 'pending', 'success': None}
+            # Forget the oldest finished jobs; pending ones are still awaited
+            excess = len(self._write_results) - MAX_WRITE_JOBS
+            if excess > 0:
+                done = [key for key, job in self._write_results.items() if job['status'] == 'done']
+                for key in done[:excess]:
+                    del self._write_results[key]
+
+            if self._poll_thread is not None:
+                self._write_jobs.put((job_id, text, lang_code))
+                return job_id
+
+        self._run_write_job(job_id, text, lang_code)
+        return job_id
+
+    def get_write_job(self, job_id: str) -> Optional[dict]:
+        """
+        Returns {'text', 'status', 'success'} for a submitted write, where
+        status is 'pending' or 'done', or None for an unknown job id.
+        """
+        with self._write_results_lock:
+            return self._write_results.get(job_id)
+
+    def _run_write_job(self, job_id: str, text: str, lang_code: str) -> None:
+        try:
+            success = self.write_text(text, lang_code)
+        except Exception as exc:
+            logger.warning("RFID: Error writing tag: %s", exc)
+            success = False
+        self._finish_write_job(job_id, text, success)
+
+    def _finish_write_job(self, job_id: str, text: str, success: bool) -> None:
+        with self._write_results_lock:
+            if job_id in self._write_results:
+                self._write_results[job_id] = {'text': text, 'status': 'done', 'success': success}
+
+    def _poll_loop(self, interval: float) -> None:
+        while not self._stop_polling.is_set():
+            try:
+                job = self._write_jobs.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                self._run_write_job(*job)
+
+            try:
+                self.wait_for_tag()
+                uid, text = self.read_tag()
+            except Exception as exc:
+                logger.warning("RFID: Error while polling: %s", exc)
+                # Forget the tag so it is read again once the reader recovers
+                self.last_uid = None
+                self._soft_reset()
+                uid, text = None, None
+
+            if uid is not None:
+                self._publish_tag((uid, text))
+
+            self._stop_polling.wait(interval)
+
+    def _soft_reset(self) -> None:
+        """
+        Recovers the RC522 after a poll error by re-running pirc522's
+        register init (soft reset + antenna on). SPI and GPIO stay open,
+        so there is no re-open or stabilisation sleep.
+        """
+        if self.rfid is None:
+            return
+        with self._lock:
+            try:
+                self.rfid.init()
+            except Exception as exc:
+                logger.warning("RFID: Soft reset failed: %s", exc)
+
+    def wait_for_tag(self, timeout: float = 1.0) -> None:
+        """
+        Blocks until the RC522 raises its card-detect interrupt or the
+        timeout expires. The timeout keeps tag removal detection and
+        write_text() from waiting indefinitely. Returns immediately when
+        no IRQ pin is configured, leaving callers to poll read_tag().
+        """
+        if self.rfid is None or PIN_RFID_IRQ is None:
+            return
+        with self._lock:
+            self.rfid.wait_for_tag(timeout)
+
     def read_tag(self) -> tuple[Optional[str], Optional[str]]:
         """
         Polls for a new RFID tag, returning its UID string the first time
@@ -38,7 +340,11 @@ class Reader:
         if not self.rfid:
             return None, None
 
-        uid_str = None
+        with self._lock:
+            return self._read_tag_locked()
+
+    def _read_tag_locked(self) -> tuple[Optional[str], Optional[str]]:
+        uid_int = None
         uid_bytes: Optional[List[int]] = None
 
         (error, _) = self.rfid.request()
@@ -46,20 +352,22 @@ class Reader:
             (error, uid) = self.rfid.anticoll()
             if not error:
                 uid_bytes = uid
-                uid_str = "".join(map(str, uid))
-                self.rfid.stop_crypto()
+                uid_int = int.from_bytes(bytes(uid), "big")
+                # NTAG reads never start Crypto-1, so there is nothing to stop.
 
-        if uid_str and uid_str != self.last_uid:
-            self.last_uid = uid_str
-            print(f"RFID: New tag detected with UID {uid_str}")
+        if uid_int is not None and uid_int != self.last_uid:
+            self.last_uid = uid_int
+            # Only format the UID string once per new tag.
+            uid_str = bytes(uid_bytes).hex()
+            logger.info("RFID: New tag detected with UID %s", uid_str)
 
             text_payload = self._read_ndef_text(uid_bytes)
 
             return uid_str, text_payload
 
-        if not uid_str:
+        if uid_int is None:
             if self.last_uid is not None:
-                print("RFID: Tag removed from reader")
+                logger.info("RFID: Tag removed from reader")
             self.last_uid = None
 
         return None, None
@@ -75,72 +383,195 @@ class Reader:
         raw_bytes = self._read_pages(
             uid_bytes,
             TAG_NDEF_START_PAGE,
-            TAG_NDEF_PAGE_COUNT
+            TAG_NDEF_PAGE_COUNT,
+            stop_at_ndef_end=True
         )
         if not raw_bytes:
             return None
 
-        tlv_idx = 0
-        while tlv_idx < len(raw_bytes):
-            tlv_type = raw_bytes[tlv_idx]
+        # On most tags the NDEF TLV comes first, possibly after NULL padding.
+        # Jump straight to it with C-level find/count and only walk the TLVs
+        # one by one when another TLV (e.g. Lock Control) precedes it.
+        # Walk a memoryview so the NDEF message handed to the parser is a
+        # zero-copy slice of the page buffer.
+        mv = memoryview(raw_bytes)
+        n = len(mv)
+
+        tlv_idx = raw_bytes.find(b'\x03')
+        if tlv_idx < 0 or raw_bytes.count(0, 0, tlv_idx) != tlv_idx:
+            tlv_idx = 0
+        elif tlv_idx + 1 < n and mv[tlv_idx + 1] != 0xFF:
+            # Short-form length: hand the message over without walking.
+            start = tlv_idx + 2
+            return self._parse_text_record(mv[start:start + mv[tlv_idx + 1]])
+
+        while tlv_idx < n:
+            tlv_type = mv[tlv_idx]
             tlv_idx += 1
 
             if tlv_type == 0x00:
                 continue  # NULL TLV
             if tlv_type == 0xFE:
                 break  # Terminator TLV
-            if tlv_idx >= len(raw_bytes):
+            if tlv_idx >= n:
                 break
 
-            length = raw_bytes[tlv_idx]
+            length = mv[tlv_idx]
             tlv_idx += 1
             if length == 0xFF:
-                if tlv_idx + 1 >= len(raw_bytes):
+                if tlv_idx + 1 >= n:
                     break
-                length = (raw_bytes[tlv_idx] << 8) + raw_bytes[tlv_idx + 1]
+                length = _U16BE.unpack_from(mv, tlv_idx)[0]
                 tlv_idx += 2
 
             if tlv_type == 0x03:
-                ndef_message = raw_bytes[tlv_idx:tlv_idx + length]
-                return self._parse_text_record(ndef_message)
+                return self._parse_text_record(mv[tlv_idx:tlv_idx + length])
 
             tlv_idx += length
 
         return None
 
-    def _read_pages(self, uid_bytes: List[int], start_page: int, page_count: int) -> Optional[bytes]:
+    def _read_pages(self, uid_bytes: List[int], start_page: int, page_count: int,
+                    stop_at_ndef_end: bool = False) -> Optional[bytes]:
         """
-        Reads raw bytes from NTAG-style tags (4 bytes per page, read in
-        16-byte chunks). No authentication required for default tags.
+        Reads raw bytes from NTAG-style tags (4 bytes per page), using
+        FAST_READ bursts and falling back to 16-byte READs for tags that
+        lack it. No authentication required for default tags.
+        With `stop_at_ndef_end`, reading stops as soon as the NDEF TLV or a
+        Terminator TLV has been read, so short messages cost fewer READs.
         """
+        size = page_count * 4
         if page_count <= 0:
             return None
 
-        payload = bytearray()
+        # Responses are clipped to the requested window, so the buffer size is known up front.
+        payload = bytearray(size)
+        offset = 0
         current_page = start_page
         final_page = start_page + page_count
+        use_fast_read = True
 
         while current_page < final_page:
             if self.rfid is None:
                 return None
-            error, data = self.rfid.read(current_page)
-            if error:
-                print(f"RFID: Error reading starting at page {current_page}.")
-                return None
 
-            payload.extend(data)
-            current_page += 4  # read command returns 4 pages (16 bytes)
+            data = None
+            if use_fast_read:
+                last_page = min(current_page + FAST_READ_MAX_PAGES, final_page) - 1
+                data = self._fast_read(current_page, last_page)
+                if data is None:
+                    # Tags without FAST_READ (e.g. original Ultralight) NAK the
+                    # first burst; stick to READ for them. A later failure is
+                    # treated as an RF error and only this chunk uses READ.
+                    # Either way the tag has dropped to IDLE, so wake it first.
+                    if current_page == start_page:
+                        use_fast_read = False
+                    if not self._wake_tag():
+                        logger.warning("RFID: Tag lost after FAST_READ at page %d.", current_page)
+                        return None
+
+            if data is None:
+                # Retry a failed READ a few times before giving up on the whole
+                # payload; a marginal RF read usually succeeds on the next try.
+                # A failed exchange leaves the tag in IDLE, so wake it first.
+                for attempt in range(READ_ATTEMPTS):
+                    if attempt and not self._wake_tag():
+                        break
+                    error, data = self._read_block(current_page)
+                    if not error:
+                        break
+                if error:
+                    logger.warning("RFID: Error reading starting at page %d.", current_page)
+                    return None
+
+            # READ always returns 4 pages; drop any beyond the requested window.
+            n = min(len(data), (final_page - current_page) * 4)
+            payload[offset:offset + n] = data[:n]
+            offset += n
+            current_page += n // 4
+
+            if stop_at_ndef_end and _tlv_area_end(payload, offset) is not None:
+                size = offset
+                break
+
+        return bytes(payload[:size])
+
+    def _fast_read(self, start_page: int, end_page: int) -> Optional[bytes]:
+        """
+        Reads pages start_page..end_page (inclusive) with a single NTAG
+        FAST_READ. Returns None if the tag rejects the command or the
+        response is short.
+        """
+        buf = [NTAG_FAST_READ_CMD, start_page, end_page]
+        buf.extend(_crc_a(buf))
+        return self._transceive(buf, (end_page - start_page + 1) * 4)
+
+    def _read_block(self, page: int) -> tuple[bool, Optional[bytes]]:
+        """
+        Reads 4 pages (16 bytes) with READ, returning (error, data) like
+        pirc522's read() but draining the FIFO in one SPI transfer.
+        """
+        buf = [NTAG_READ_CMD, page]
+        buf.extend(_crc_a(buf))
+        data = self._transceive(buf, 16)
+        return data is None, data
+
+    def _transceive(self, data: List[int], expected: int) -> Optional[bytes]:
+        """
+        Sends `data` to the tag and returns the first `expected` bytes of
+        the response, or None on timeout, error or a short response.
+
+        Works like pirc522's card_write() in Transceive mode, but fills
+        and drains the FIFO with one SPI transfer each instead of one
+        transfer per byte.
+        """
+        rfid = self.rfid
+        rfid.dev_write(_COM_IEN_REG, 0xF7)
+        rfid.clear_bitmask(_COM_IRQ_REG, 0x80)
+        rfid.set_bitmask(_FIFO_LEVEL_REG, 0x80)  # Flush the FIFO
+        rfid.dev_write(_COMMAND_REG, rfid.mode_idle)
+
+        rfid.spi_transfer([_FIFO_WRITE_ADDR, *data])
+        rfid.dev_write(_COMMAND_REG, rfid.mode_transrec)
+        rfid.set_bitmask(_BIT_FRAMING_REG, 0x80)  # StartSend
+
+        # Wait for RxIRq/IdleIRq, or TimerIRq if the tag stays silent
+        for _ in range(2000):
+            irq = rfid.dev_read(_COM_IRQ_REG)
+            if irq & 0x31:
+                break
+        else:
+            irq = 0
+        rfid.clear_bitmask(_BIT_FRAMING_REG, 0x80)
+
+        if not irq & 0x30 or rfid.dev_read(_ERROR_REG) & 0x1B:
+            return None
+        if rfid.dev_read(_FIFO_LEVEL_REG) < expected:
+            return None
+
+        # Repeating the read address clocks out one FIFO byte per SPI byte.
+        response = rfid.spi_transfer([_FIFO_READ_ADDR] * expected + [0])
+        return bytes(response[1:])
 
-        return bytes(payload[:page_count * 4])
+    def _wake_tag(self) -> bool:
+        """
+        Brings a tag back to the READY state with REQA + anticollision.
+        """
+        error, _ = self.rfid.request()
+        if not error:
+            error, _ = self.rfid.anticoll()
+        return not error
 
-    def _parse_text_record(self, message: bytes) -> Optional[str]:
+    def _parse_text_record(self, message: memoryview) -> Optional[str]:
         """
         Parses the first Well Known 'T' record contained in the NDEF message.
+        Slices stay views into the caller's buffer until the text is decoded.
         """
         if not message:
             return None
 
         try:
+            message = memoryview(message)
             idx = 0
             header = message[idx]
             idx += 1
@@ -155,7 +586,7 @@ class Reader:
                 payload_length = message[idx]
                 idx += 1
             else:
-                payload_length = int.from_bytes(message[idx:idx + 4], "big")
+                payload_length = _U32BE.unpack_from(message, idx)[0]
                 idx += 4
 
             if il:
@@ -170,7 +601,7 @@ class Reader:
 
             payload = message[idx:idx + payload_length]
 
-            if record_type.decode("ascii", errors="ignore") != "T" or not payload:
+            if record_type != b"T" or not payload:
                 return None
 
             status = payload[0]
@@ -178,11 +609,10 @@ class Reader:
             lang_length = status & 0x3F
 
             text_bytes = payload[1 + lang_length:]
-            encoding = "utf-16" if is_utf16 else "utf-8"
-            text = text_bytes.decode(encoding, errors="ignore").strip()
+            text = _TEXT_DECODERS[is_utf16](text_bytes, "ignore")[0].strip()
             return text or None
         except Exception as exc:
-            print(f"RFID: Failed to parse NDEF text record: {exc}")
+            logger.warning("RFID: Failed to parse NDEF text record: %s", exc)
             return None
 
     def write_text(self, text: str, lang_code: str = "en") -> bool:
@@ -197,25 +627,28 @@ class Reader:
             True if write was successful, False otherwise
         """
         if not self.rfid:
-            print("RFID: No RFID reader available")
+            logger.warning("RFID: No RFID reader available")
             return False
 
-        print(f"RFID: Attempting to write text: '{text}'")
+        with self._lock:
+            return self._write_text_locked(text, lang_code)
+
+    def _write_text_locked(self, text: str, lang_code: str) -> bool:
+        logger.info("RFID: Attempting to write text: %r", text)
 
         # Wait for a tag to be present
-        print("RFID: Waiting for tag...")
+        logger.debug("RFID: Waiting for tag...")
         (error, _) = self.rfid.request()
         if error:
-            print("RFID: No tag detected")
+            logger.warning("RFID: No tag detected")
             return False
 
         (error, uid) = self.rfid.anticoll()
         if error:
-            print("RFID: Error during anticollision")
+            logger.warning("RFID: Error during anticollision")
             return False
 
-        uid_str = "".join(map(str, uid))
-        print(f"RFID: Tag detected with UID: {uid_str}")
+        logger.info("RFID: Tag detected with UID: %s", bytes(uid).hex())
 
         # Note: We do NOT call select_tag() for NTAG/Ultralight cards
         # Unlike MIFARE Classic, NTAG doesn't require selection/authentication
@@ -224,15 +657,14 @@ class Reader:
         # Create NDEF text record
         ndef_message = self._create_text_record(text, lang_code)
         if not ndef_message:
-            print("RFID: Failed to create NDEF message")
+            logger.warning("RFID: Failed to create NDEF message")
             return False
 
-        print(f"RFID: Created NDEF message ({len(ndef_message)} bytes)")
-        print(f"RFID: NDEF hex: {ndef_message.hex()}")
+        logger.debug("RFID: Created NDEF message (%d bytes): %s", len(ndef_message), ndef_message.hex())
 
         # Wrap in TLV structure
         tlv_data = self._create_tlv_wrapper(ndef_message)
-        print(f"RFID: TLV data ({len(tlv_data)} bytes): {tlv_data.hex()}")
+        logger.debug("RFID: TLV data (%d bytes): %s", len(tlv_data), tlv_data.hex())
 
         # Write to tag
         success = self._write_pages(uid, tlv_data, TAG_NDEF_START_PAGE)
@@ -240,9 +672,9 @@ class Reader:
         self.rfid.stop_crypto()
 
         if success:
-            print("RFID: Write successful!")
+            logger.info("RFID: Write successful")
         else:
-            print("RFID: Write failed")
+            logger.warning("RFID: Write failed")
 
         return success
 
@@ -264,12 +696,13 @@ class Reader:
             text_bytes = text.encode("utf-8")
             lang_bytes = lang_code.encode("ascii")
 
+            lang_length = len(lang_bytes)
+
             # Status byte: bit 7 = encoding (0=UTF-8), bits 0-5 = lang code length
-            status = len(lang_bytes) & 0x3F
+            status = lang_length & 0x3F
 
             # Payload = status + lang code + text
-            payload = bytes([status]) + lang_bytes + text_bytes
-            payload_length = len(payload)
+            payload_length = 1 + lang_length + len(text_bytes)
 
             # Record header: MB=1, ME=1, SR=1, TNF=1 (Well-Known)
             # MB (Message Begin) = 0x80
@@ -281,17 +714,20 @@ class Reader:
             # Type length (1 byte for 'T')
             type_length = 1
 
-            # Build the record
-            record = bytes([header, type_length, payload_length])
-            record += b'T'  # Record type
-            record += payload
+            # Build the record in one buffer of its final size; packing fails
+            # if the payload length won't fit a short record.
+            record = bytearray(4 + payload_length)
+            _TEXT_RECORD_PREFIX.pack_into(record, 0, header, type_length, payload_length, b'T', status)
+            record[5:5 + lang_length] = lang_bytes
+            record[5 + lang_length:] = text_bytes
 
-            print(f"RFID: Text record created - Header: 0x{header:02X}, Type: T, Payload length: {payload_length}")
+            logger.debug("RFID: Text record created - Header: 0x%02X, Type: T, Payload length: %d",
+                         header, payload_length)
 
-            return record
+            return bytes(record)
 
         except Exception as exc:
-            print(f"RFID: Error creating text record: {exc}")
+            logger.warning("RFID: Error creating text record: %s", exc)
             return None
 
     def _create_tlv_wrapper(self, ndef_message: bytes) -> bytes:
@@ -339,55 +775,33 @@ class Reader:
         if not self.rfid or len(data) != 4:
             return False
 
-        # First, verify the card is still responsive by doing a read
-        print(f"RFID: Verifying card is responsive by reading page {page_num}...")
-        (read_error, read_data) = self.rfid.read(page_num)
-        if read_error:
-            print(f"RFID: Card not responsive, cannot write")
-            return False
-        print(f"RFID: Card responsive, current data: {read_data[:4]}")
-
-        # MIFARE Ultralight/NTAG WRITE command (compatibility write)
-        NTAG_WRITE_CMD = 0xA2
-
-        print(f"RFID: Writing page {page_num}: {[hex(b) for b in data]}")
-
-        # Build complete buffer: CMD + Page + 4 Data Bytes (all in one transaction)
-        buf = [NTAG_WRITE_CMD, page_num]
-        buf.extend(data)
-
-        # Calculate and append CRC
-        crc = self.rfid.calculate_crc(buf)
-        buf.append(crc[0])
-        buf.append(crc[1])
+        logger.debug("RFID: Writing page %d: %s", page_num, bytes(data).hex())
 
-        print(f"RFID: Sending single-phase write: {[hex(b) for b in buf]}")
+        # Build complete buffer: CMD + Page + 4 Data Bytes + CRC (all in one transaction)
+        buf = [NTAG_WRITE_CMD, page_num, *data]
+        buf.extend(_crc_a(buf))
 
-        # Send the complete write command in one transaction
         (error, back_data, back_length) = self.rfid.card_write(self.rfid.mode_transrec, buf)
 
-        print(f"RFID: Response - error={error}, back_length={back_length}, back_data={back_data if not error else 'N/A'}")
-
         # For NTAG write, we might get a different response than MIFARE Classic
         # The ACK might be encoded differently or the response length might vary
         if back_length == 0:
-            print(f"RFID: No response from card - write may have succeeded, verifying...")
-            # Verify by reading back
-            time.sleep(0.05)
+            logger.debug("RFID: No response for page %d - verifying by reading back", page_num)
+            # Verify by reading back once the EEPROM write (~4ms on NTAG21x) is done
+            time.sleep(0.005)
             (verify_error, verify_data) = self.rfid.read(page_num)
-            if not verify_error and verify_data[:4] == data:
-                print(f"RFID: Verification successful! Data matches.")
+            if not verify_error and verify_data[:4] == list(data):
                 return True
-            else:
-                print(f"RFID: Verification failed. Expected {data}, got {verify_data[:4] if not verify_error else 'read error'}")
-                return False
+            logger.warning("RFID: Verification failed for page %d. Expected %s, got %s",
+                           page_num, list(data), verify_data[:4] if not verify_error else "read error")
+            return False
 
         # Check for ACK response (should be 4 bits with value 0x0A)
         if error or back_length != 4 or (back_data[0] & 0x0F) != 0x0A:
-            print(f"RFID: Write failed - Expected ACK (0x0A), got {hex(back_data[0] & 0x0F) if not error and back_data else 'error'}")
+            logger.warning("RFID: Write failed - Expected ACK (0x0A), got %s",
+                           hex(back_data[0] & 0x0F) if not error and back_data else "error")
             return False
 
-        print(f"RFID: Page {page_num} write ACKed successfully!")
         return True
 
     def _write_pages(self, uid: List[int], data: bytes, start_page: int) -> bool:
@@ -405,35 +819,46 @@ class Reader:
         if not self.rfid:
             return False
 
-        # Calculate number of pages needed (4 bytes per page)
-        page_count = (len(data) + 3) // 4
-        print(f"RFID: Writing {len(data)} bytes across {page_count} pages starting at page {start_page}")
+        # Pad once to a whole number of pages (4 bytes per page); callers using
+        # _create_tlv_wrapper() already pass page-aligned data.
+        data = bytes(data)
+        if len(data) % 4:
+            data += bytes(4 - len(data) % 4)
+        page_count = len(data) // 4
+        logger.info("RFID: Writing %d bytes across %d pages starting at page %d", len(data), page_count, start_page)
 
+        # Check once that the card answers before sending the WRITEs back to back
+        (read_error, _) = self.rfid.read(start_page)
+        if read_error:
+            logger.warning("RFID: Card not responsive, cannot write")
+            return False
+
+        mv = memoryview(data)
         for i in range(page_count):
             page_num = start_page + i
             offset = i * 4
-            page_data = data[offset:offset + 4]
-
-            # Pad to 4 bytes if needed
-            if len(page_data) < 4:
-                page_data = page_data + bytes([0x00] * (4 - len(page_data)))
-
-            print(f"RFID: Writing page {page_num}: {page_data.hex()} (bytes: {list(page_data)})")
 
             # Use NTAG-specific write method (0xA2 command for 4-byte pages)
-            success = self._write_ntag_page(page_num, list(page_data))
-            if not success:
-                print(f"RFID: Error writing page {page_num}")
+            if not self._write_ntag_page(page_num, list(mv[offset:offset + 4])):
+                logger.warning("RFID: Error writing page %d", page_num)
                 return False
 
-            print(f"RFID: Page {page_num} written successfully")
-
-            # Small delay between page writes
-            time.sleep(0.05)
-
+        logger.info("RFID: Wrote pages %d-%d", start_page, start_page + page_count - 1)
         return True
 
     def cleanup(self):
+        if self._poll_thread is not None:
+            self._stop_polling.set()
+            self._poll_thread.join(timeout=2.0)
+            with self._write_results_lock:
+                self._poll_thread = None
+                # Writes the poll thread never got to will not happen now
+                while True:
+                    try:
+                        job_id, text, _ = self._write_jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._write_results[job_id] = {'text': text, 'status': 'done', 'success': False}
         if self.rfid:
             self.rfid.cleanup()
             print("RFID reader resources cleaned up.")
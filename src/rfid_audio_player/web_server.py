@@ -1,12 +1,41 @@
 # web_server.py
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
+from functools import lru_cache
+import json
 import os
 import threading
-import pygame
 import subprocess
 import shutil
+from .audio_player import folder_signature
 from .config import MEDIA_PATH, SUPPORTED_EXTENSIONS
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Pre-encoded body for the constant {'success': True} reply
+_SUCCESS_BODY = json.dumps({'success': True}, separators=(',', ':')).encode()
+
+
+@lru_cache(maxsize=64)
+def _scan_audio_files(folder_path: str, signature: tuple[int, ...]) -> tuple[tuple[str, int], ...]:
+    """
+    Returns (relative path, size) for supported audio files located in the
+    folder or its nested 'Converted' directory. `signature` is only part
+    of the cache key, so a changed folder is rescanned.
+    """
+    files = []
+    for directory, rel_dir in ((folder_path, ''), (os.path.join(folder_path, 'Converted'), 'Converted/')):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.name.lower().endswith(SUPPORTED_EXTENSIONS):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    files.append((rel_dir + entry.name, entry.stat().st_size))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return tuple(files)
+
 class WebServer:
     def __init__(self, audio_player, rfid_reader=None):
         """Initialize the Flask web server with a reference to the AudioPlayer and optional RFID Reader."""
@@ -17,6 +46,8 @@ class WebServer:
         project_root = os.path.dirname(os.path.dirname(current_dir))
         static_folder = os.path.join(project_root, 'static')
         self.app = Flask(__name__, static_folder=static_folder, static_url_path='')
+        # The UI never relies on key order, so skip sorting on every jsonify()
+        self.app.json.sort_keys = False
         self._setup_routes()
 
     def _setup_routes(self):
@@ -30,10 +61,7 @@ class WebServer:
         # Get current player status
         @self.app.route('/api/status', methods=['GET'])
         def get_status():
-            current_track = None
-            if self.audio_player.current_playlist and self.audio_player.current_track_index >= 0:
-                track_path = self.audio_player.current_playlist[self.audio_player.current_track_index]
-                current_track = os.path.basename(track_path)
+            current_track = self.audio_player.get_current_track_name()
 
             position_seconds = self.audio_player.get_current_position()
             duration_seconds = self.audio_player.current_track_duration
@@ -41,7 +69,7 @@ class WebServer:
             return jsonify({
                 'playing': self.audio_player.playing,
                 'paused': self.audio_player.paused,
-                'volume': int(pygame.mixer.music.get_volume() * 100),
+                'volume': round(self.audio_player.get_volume() * 100),
                 'current_track': current_track,
                 'track_index': self.audio_player.current_track_index + 1 if self.audio_player.current_track_index >= 0 else 0,
                 'total_tracks': len(self.audio_player.current_playlist),
@@ -60,13 +88,13 @@ class WebServer:
         @self.app.route('/api/next', methods=['POST'])
         def next_track():
             self.audio_player.next_track()
-            return jsonify({'success': True})
+            return Response(_SUCCESS_BODY, mimetype='application/json')
 
         # Previous track
         @self.app.route('/api/prev', methods=['POST'])
         def prev_track():
             self.audio_player.prev_track()
-            return jsonify({'success': True})
+            return Response(_SUCCESS_BODY, mimetype='application/json')
 
         # Set volume (0-100)
         @self.app.route('/api/volume', methods=['POST'])
@@ -74,7 +102,7 @@ class WebServer:
             data = request.get_json()
             volume = data.get('volume', 50)
             volume = max(0, min(100, volume))  # Clamp between 0-100
-            pygame.mixer.music.set_volume(volume / 100.0)
+            self.audio_player.set_volume(volume / 100.0)
             return jsonify({'success': True, 'volume': volume})
 
         @self.app.route('/api/seek', methods=['POST'])
@@ -104,15 +132,18 @@ class WebServer:
         @self.app.route('/api/media/folders', methods=['GET'])
         def get_folders():
             folders = []
-            if os.path.exists(MEDIA_PATH):
-                for item in os.listdir(MEDIA_PATH):
-                    folder_path = os.path.join(MEDIA_PATH, item)
-                    if os.path.isdir(folder_path):
-                        audio_files = self._list_folder_audio_files(folder_path)
-                        folders.append({
-                            'name': item,
-                            'file_count': len(audio_files),
-                        })
+            try:
+                # scandir carries each entry's type, so no isdir() stat per item
+                with os.scandir(MEDIA_PATH) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            audio_files = _scan_audio_files(entry.path, folder_signature(entry.path))
+                            folders.append({
+                                'name': entry.name,
+                                'file_count': len(audio_files),
+                            })
+            except FileNotFoundError:
+                pass
             return jsonify({'folders': folders})
 
         # Get files in a specific folder
@@ -123,12 +154,12 @@ class WebServer:
                 return jsonify({'error': 'Folder not found'}), 404
 
             files = []
-            for info in self._list_folder_audio_files(folder_path):
+            for relative_path, size in _scan_audio_files(folder_path, folder_signature(folder_path)):
                 files.append({
-                    'name': info['display_name'],
-                    'path': info['relative_path'],
-                    'size': info['size'],
-                    'size_mb': round(info['size'] / (1024 * 1024), 2)
+                    'name': relative_path,
+                    'path': relative_path,
+                    'size': size,
+                    'size_mb': round(size / (1024 * 1024), 2)
                 })
 
             return jsonify({'files': files})
@@ -147,6 +178,7 @@ class WebServer:
 
             try:
                 os.remove(file_path)
+                _scan_audio_files.cache_clear()
                 return jsonify({'success': True, 'message': f'Deleted {filename}'})
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -166,12 +198,19 @@ class WebServer:
                 return jsonify({'error': 'No file selected'}), 400
 
             # Check file extension
-            if not any(file.filename.endswith(ext) for ext in SUPPORTED_EXTENSIONS):
+            if not file.filename.lower().endswith(SUPPORTED_EXTENSIONS):
                 return jsonify({'error': f'Unsupported file type. Allowed: {", ".join(SUPPORTED_EXTENSIONS)}'}), 400
 
             try:
                 file_path = os.path.join(folder_path, file.filename)
-                file.save(file_path)
+                # Copy in 1 MiB chunks instead of Werkzeug's 16 KiB default
+                with open(file_path, 'wb', buffering=0) as out:
+                    shutil.copyfileobj(file.stream, out, length=UPLOAD_CHUNK_SIZE)
+                    if hasattr(os, 'posix_fadvise'):
+                        # Keep large uploads from evicting the page cache
+                        os.fsync(out.fileno())
+                        os.posix_fadvise(out.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                _scan_audio_files.cache_clear()
                 return jsonify({'success': True, 'message': f'Uploaded {file.filename}'})
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -206,6 +245,7 @@ class WebServer:
 
             try:
                 os.makedirs(folder_path)
+                _scan_audio_files.cache_clear()
                 return jsonify({'success': True, 'message': f'Created folder {folder_name}'})
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -222,6 +262,7 @@ class WebServer:
                 for f in os.listdir(folder_path):
                     os.remove(os.path.join(folder_path, f))
                 os.rmdir(folder_path)
+                _scan_audio_files.cache_clear()
                 return jsonify({'success': True, 'message': f'Deleted folder {folder_name}'})
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -229,6 +270,7 @@ class WebServer:
         @self.app.route('/api/media/convert', methods=['POST'])
         def convert_media():
             result = self._convert_unsupported_files()
+            _scan_audio_files.cache_clear()
             status_code = 200 if result.get('success') else 500
             return jsonify(result), status_code
 
@@ -245,15 +287,25 @@ class WebServer:
             if not text:
                 return jsonify({'error': 'Text is required'}), 400
 
-            try:
-                # Attempt to write to the tag
-                success = self.rfid_reader.write_text(text, lang_code)
-                if success:
-                    return jsonify({'success': True, 'message': f'Successfully wrote "{text}" to NFC tag'})
-                else:
-                    return jsonify({'error': 'Failed to write to NFC tag. Make sure a tag is present.'}), 500
-            except Exception as e:
-                return jsonify({'error': f'Error writing to NFC tag: {str(e)}'}), 500
+            # The RFID poll thread performs the write; the client polls the job.
+            job_id = self.rfid_reader.submit_write(text, lang_code)
+            return jsonify({'success': True, 'job_id': job_id}), 202
+
+        # Status of a queued NFC write
+        @self.app.route('/api/nfc/jobs/<job_id>', methods=['GET'])
+        def get_nfc_job(job_id):
+            if self.rfid_reader is None:
+                return jsonify({'error': 'RFID reader not available'}), 503
+
+            job = self.rfid_reader.get_write_job(job_id)
+            if job is None:
+                return jsonify({'error': 'Job not found'}), 404
+
+            if job['status'] == 'pending':
+                return jsonify({'status': 'pending'})
+            if job['success']:
+                return jsonify({'status': 'done', 'success': True, 'message': f'Successfully wrote "{job["text"]}" to NFC tag'})
+            return jsonify({'status': 'done', 'success': False, 'error': 'Failed to write to NFC tag. Make sure a tag is present.'})
 
     def _convert_unsupported_files(self) -> dict:
         """
@@ -341,50 +393,19 @@ class WebServer:
             'skipped_count': skipped_count
         }
 
-    def _list_folder_audio_files(self, folder_path: str) -> list[dict]:
+    def run(self, host='0.0.0.0', port=5000):
         """
-        Returns metadata about supported audio files located in the folder
-        or its nested 'Converted' directory.
+        Run the web server in a separate thread. Uses waitress when it is
+        installed and falls back to Flask's built-in development server.
         """
-        files = []
-        search_dirs = [folder_path]
-        converted_dir = os.path.join(folder_path, 'Converted')
-        if os.path.isdir(converted_dir):
-            search_dirs.append(converted_dir)
-
-        for directory in search_dirs:
-            try:
-                entries = os.listdir(directory)
-            except FileNotFoundError:
-                continue
-
-            rel_dir = os.path.relpath(directory, folder_path)
-            rel_dir = '' if rel_dir == '.' else rel_dir
-
-            for entry in entries:
-                if not any(entry.lower().endswith(ext) for ext in SUPPORTED_EXTENSIONS):
-                    continue
-
-                abs_path = os.path.join(directory, entry)
-                if not os.path.isfile(abs_path):
-                    continue
-
-                relative_path = os.path.join(rel_dir, entry) if rel_dir else entry
-                relative_path = relative_path.replace('\\', '/')
-
-                files.append({
-                    'absolute_path': abs_path,
-                    'relative_path': relative_path,
-                    'display_name': relative_path,
-                    'size': os.path.getsize(abs_path),
-                })
-
-        return files
-
-    def run(self, host='0.0.0.0', port=5000):
-        """Run the Flask server in a separate thread."""
-        def run_server():
-            self.app.run(host=host, port=port, debug=False, threaded=True)
+        try:
+            from waitress import serve
+        except ImportError:
+            def run_server():
+                self.app.run(host=host, port=port, debug=False, threaded=True)
+        else:
+            def run_server():
+                serve(self.app, host=host, port=port, threads=4, _quiet=True)
 
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()